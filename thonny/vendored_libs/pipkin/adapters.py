@@ -359,10 +359,11 @@ class LocalMirrorAdapter(BaseAdapter, ABC):
         assert not os.path.isdir(local_path)
 
         block_size = 4 * 1024
+        # slicing a memoryview doesn't copy the remaining content for each block
+        view = memoryview(content)
         with open(local_path, "wb") as fp:
-            while content:
-                block = content[:block_size]
-                content = content[block_size:]
+            for start in range(0, len(view), block_size):
+                block = view[start : start + block_size]
                 bytes_written = fp.write(block)
                 fp.flush()
                 os.fsync(fp)
@@ -24,6 +24,7 @@ SOFTWARE.
 import copy
 import email.parser
 import errno
+import gzip
 import hashlib
 import io
 import json
@@ -31,28 +32,33 @@ import logging
 import os.path
 import shlex
 import socket
+import ssl
 import subprocess
 import sys
 import tarfile
 import tempfile
 import textwrap
 import threading
+import time
 import zipfile
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from html.parser import HTMLParser
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from socketserver import BaseServer
 from textwrap import dedent
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, BinaryIO, ContextManager, Dict, Iterator, List, Optional, Tuple, Union
 from urllib.error import HTTPError
 from urllib.request import urlopen
 
-from pkg_resources import safe_name, safe_version
-
 from pipkin.util import (
     create_dist_info_version_name,
     custom_normalize_dist_name,
+    get_pipkin_cache_dir,
     parse_dist_file_name,
+    safe_name,
+    safe_version,
 )
 
 MP_ORG_INDEX_V1 = "https://micropython.org/pi"
@@ -77,6 +83,18 @@ NORMALIZED_IRRELEVANT_PACKAGE_NAMES = {
 # For efficient caching it's better if the proxy always runs at the same port
 PREFERRED_PORT = 36628
 
+# Chunk size for copying member content between archives
+COPY_BUFFER_SIZE = 64 * 1024
+
+# How long index metadata may be reused from the disk cache
+INDEX_METADATA_MAX_AGE = 60 * 60
+
+# Downloading is network-bound, so the number of threads doesn't depend on the number of CPUs
+MAX_DOWNLOAD_WORKERS = 8
+
+# Seconds to wait for connecting to or receiving data from an index
+DOWNLOAD_TIMEOUT = 30
+
 logger = logging.getLogger(__name__)
 
 
@@ -85,6 +103,130 @@ def shlex_join(split_command):
     return " ".join(shlex.quote(arg) for arg in split_command)
 
 
+def open_gzip_stream(fp: BinaryIO) -> BinaryIO:
+    """
+    Returns a stream of decompressed data, which gets decompressed incrementally while read.
+    A faster implementation can be plugged in here, as long as it also doesn't need to
+    hold all decompressed data in memory.
+    """
+    return gzip.GzipFile(fileobj=fp, mode="rb")
+
+
+def _create_http_session() -> Optional[Any]:
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+    except ImportError:
+        return None
+
+    class SystemCertsAdapter(HTTPAdapter):
+        # Trust the same CA-s as urllib does (system store) instead of certifi's bundle only
+        def init_poolmanager(self, *args, **kwargs):
+            kwargs["ssl_context"] = ssl.create_default_context()
+            return super().init_poolmanager(*args, **kwargs)
+
+        def proxy_manager_for(self, proxy, **proxy_kwargs):
+            proxy_kwargs["ssl_context"] = ssl.create_default_context()
+            return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+    # Reusing connections avoids a TCP and TLS handshake per request
+    session = requests.Session()
+    adapter = SystemCertsAdapter(
+        pool_connections=8,
+        pool_maxsize=2 * MAX_DOWNLOAD_WORKERS,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_http_session: Optional[Any] = None
+_http_session_created = False
+_http_session_lock = threading.Lock()
+
+
+def _get_http_session() -> Optional[Any]:
+    # Created on first use, so that importing requests doesn't slow down importing pipkin
+    global _http_session, _http_session_created
+    with _http_session_lock:
+        if not _http_session_created:
+            _http_session = _create_http_session()
+            _http_session_created = True
+        return _http_session
+
+
+@contextmanager
+def open_url(url: str) -> Iterator[BinaryIO]:
+    """
+    Yields a stream of the response body exactly as sent by the server (no Content-Encoding
+    gets decoded). Uses a keep-alive session if requests is available, otherwise urllib.
+    In both cases HTTP errors are reported as urllib.error.HTTPError.
+    """
+    logger.debug("Opening %s", url)
+    session = _get_http_session()
+    if session is None:
+        with urlopen(url, timeout=DOWNLOAD_TIMEOUT) as fp:
+            logger.debug("Headers: %r", fp.headers.items())
+            yield fp
+        return
+
+    # Like pip, ask for the identity encoding. Otherwise an index could send a .tar.gz with
+    # Content-Encoding: gzip, which requests would decompress.
+    with session.get(
+        url, timeout=DOWNLOAD_TIMEOUT, stream=True, headers={"Accept-Encoding": "identity"}
+    ) as response:
+        logger.debug("Headers: %r", response.headers.items())
+        if response.status_code >= 400:
+            raise HTTPError(url, response.status_code, response.reason, response.headers, None)
+        # requests doesn't decode content when reading from raw
+        yield response.raw
+
+
+def download_bytes(url: str) -> bytes:
+    with open_url(url) as fp:
+        return fp.read()
+
+
+def download_json(url: str, max_age: Optional[float] = INDEX_METADATA_MAX_AGE) -> Any:
+    """
+    Fetches JSON from the url, reusing the copy from pipkin's cache dir, if it's not older
+    than max_age seconds (or if max_age is None, meaning the resource is immutable).
+    HTTP errors are propagated and not cached.
+    """
+    cache_dir = os.path.join(get_pipkin_cache_dir(), "index-metadata")
+    cache_path = os.path.join(cache_dir, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+    try:
+        if max_age is None or time.time() - os.path.getmtime(cache_path) < max_age:
+            with open(cache_path, encoding="utf-8") as fp:
+                logger.debug("Using cached %s for %s", cache_path, url)
+                return json.load(fp)
+    except (OSError, ValueError):
+        # missing or broken cache entry
+        pass
+
+    data = download_bytes(url)
+    result = json.loads(data)
+
+    # write to a temporary file first so that concurrent readers never see partial content
+    tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp_path, "wb") as fp:
+            fp.write(data)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        logger.warning("Could not cache %s", url, exc_info=True)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+    return result
+
+
 class SimpleUrlsParser(HTMLParser):
     def error(self, message):
         pass
@@ -109,9 +251,29 @@ class SimpleUrlsParser(HTMLParser):
         pass
 
 
+class RecordingReader:
+    """Passes reads through to the underlying stream and keeps a copy of all data read"""
+
+    def __init__(self, fp: BinaryIO):
+        self._fp = fp
+        self._record = io.BytesIO()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._fp.read(size)
+        self._record.write(data)
+        return data
+
+    def read_all(self) -> bytes:
+        """Reads the rest of the stream and returns everything read so far"""
+        self.read()
+        return self._record.getvalue()
+
+
 class BaseIndexDownloader(ABC):
     def __init__(self, index_url: str):
         self._index_url = index_url.rstrip("/")
+        # Guards lazily filled caches, as the downloaders are queried from worker threads
+        self._cache_lock = threading.Lock()
 
     @abstractmethod
     def get_dist_file_names(self, dist_name: str) -> Optional[List[str]]:
@@ -137,140 +299,153 @@ class RegularIndexDownloader(BaseIndexDownloader, ABC):
         if self._should_return_dummy(dist_name):
             return create_dummy_dist(dist_name, file_name)
         else:
-            original_bytes = self._download_file(dist_name, file_name)
-            return self._tweak_file(dist_name, file_name, original_bytes)
+            with self._open_file(dist_name, file_name) as fp:
+                return self._tweak_file(dist_name, file_name, fp)
 
     def _get_dist_urls(self, dist_name: str) -> Optional[Dict[str, str]]:
         """
         Returns file names and url-s for constructing the dist index page.
         """
-        if dist_name not in self._dist_urls_cache:
-            self._dist_urls_cache[dist_name] = self._download_file_urls(dist_name)
+        with self._cache_lock:
+            if dist_name not in self._dist_urls_cache:
+                self._dist_urls_cache[dist_name] = self._download_file_urls(dist_name)
 
-        return self._dist_urls_cache[dist_name]
+            return self._dist_urls_cache[dist_name]
 
     @abstractmethod
     def _download_file_urls(self, dist_name) -> Optional[Dict[str, str]]:
         raise NotImplementedError()
 
-    def _download_file(self, dist_name: str, file_name: str) -> bytes:
+    def _open_file(self, dist_name: str, file_name: str) -> ContextManager[BinaryIO]:
         urls = self._get_dist_urls(dist_name)
         assert urls
 
         assert file_name in urls
         url = urls[file_name]
 
-        logger.debug("Downloading file from %s", url)
-        with urlopen(url) as result:
-            logger.debug("Headers: %r", result.headers.items())
-            return result.read()
+        return open_url(url)
 
-    def _tweak_file(self, dist_name: str, file_name: str, original_bytes: bytes) -> bytes:
+    def _tweak_file(self, dist_name: str, file_name: str, fp: BinaryIO) -> bytes:
         if not file_name.lower().endswith(".tar.gz"):
-            return original_bytes
+            return fp.read()
 
         # In case of upip packages (tar.gz-s without setup.py) reverse following process:
         # https://github.com/micropython/micropython-lib/commit/3a6ab0b
 
-        in_tar = tarfile.open(fileobj=io.BytesIO(original_bytes), mode="r:gz")
+        # The archive is parsed while it is being downloaded. Decompression is kept separate
+        # from TAR parsing (see open_gzip_stream). Members are visited strictly in order,
+        # so the data can be consumed incrementally ("r|") without ever holding the whole
+        # uncompressed tar in memory. Only the compressed bytes get recorded, because archives
+        # with setup.py are served as-is.
+        recorder = RecordingReader(fp)
         out_buffer = io.BytesIO()
-        out_tar = tarfile.open(fileobj=out_buffer, mode="w:gz")
-
-        wrapper_dir = None
-        py_modules = []
-        packages = []
-        metadata_bytes = None
-        requirements = []
-        egg_info_path = None
-
-        for info in in_tar:
-            logger.debug("Processing %r (name:%r, isfile:%r)", info, info.name, info.isfile())
-            out_info = copy.copy(info)
-
-            if info.isdir():
+        with tarfile.open(fileobj=open_gzip_stream(recorder), mode="r|") as in_tar, tarfile.open(
+            fileobj=out_buffer, mode="w:gz", copybufsize=COPY_BUFFER_SIZE
+        ) as out_tar:
+            wrapper_dir = None
+            py_modules = []
+            packages = []
+            known_packages = set()
+            metadata_bytes = None
+            requirements = []
+            egg_info_path = None
+
+            for info in in_tar:
+                # TarInfo.isfile() and isdir() re-inspect the type on each call
+                is_file = info.isfile()
+                is_dir = info.isdir()
+                logger.debug("Processing %r (name:%r, isfile:%r)", info, info.name, is_file)
+                out_info = copy.copy(info)
+                # Only the metadata files are read into memory. Other members get copied from
+                # the input stream straight to the output archive.
                 content = None
-            else:
-                with in_tar.extractfile(info) as f:
-                    content = f.read()
 
-            if "/" in info.name:
-                wrapper_dir, rel_name = info.name.split("/", maxsplit=1)
-            else:
-                assert info.isdir()
-                wrapper_dir, rel_name = info.name, ""
+                wrapper_dir, sep, rel_name = info.name.partition("/")
+                if not sep:
+                    assert is_dir
 
-            assert custom_normalize_dist_name(wrapper_dir).startswith(
-                custom_normalize_dist_name(dist_name)
-            )
+                assert custom_normalize_dist_name(wrapper_dir).startswith(
+                    custom_normalize_dist_name(dist_name)
+                )
 
-            rel_name = rel_name.strip("/")
-            rel_segments = rel_name.split("/")
-
-            # collect information about the original tar
-            if rel_name == "setup.py":
-                logger.debug("The archive contains setup.py. No tweaks needed")
-                return original_bytes
-            elif ".egg-info" in rel_name:
-                if rel_name.endswith(".egg-info/PKG-INFO"):
-                    egg_info_path = rel_name[: -len("/PKG-INFO")]
-                    metadata_bytes = content
-                elif rel_name.endswith(".egg-info/requires.txt"):
-                    requirements = content.decode("utf-8").strip().splitlines()
-            elif len(rel_segments) == 1:
-                # toplevel item outside of egg-info
-                if info.isfile() and rel_name.endswith(".py"):
-                    # toplevel module
-                    module_name = rel_name[: -len(".py")]
-                    py_modules.append(module_name)
+                rel_name = rel_name.strip("/")
+
+                # collect information about the original tar
+                if rel_name == "setup.py":
+                    logger.debug("The archive contains setup.py. No tweaks needed")
+                    return recorder.read_all()
+                elif ".egg-info" in rel_name:
+                    if rel_name.endswith(".egg-info/PKG-INFO"):
+                        egg_info_path = rel_name[: -len("/PKG-INFO")]
+                        content = metadata_bytes = self._read_member(in_tar, info)
+                    elif rel_name.endswith(".egg-info/requires.txt"):
+                        content = self._read_member(in_tar, info)
+                        requirements = [
+                            l.decode("utf-8")
+                            for l in (ln.strip() for ln in content.splitlines())
+                            if l and not l.startswith(b"#")
+                        ]
                 else:
-                    if info.isdir():
-                        # Assuming all toplevel directories represent packages.
-                        packages.append(rel_name)
-            else:
-                # Assuming an item inside a subdirectory.
-                # If it's a py, it will be included together with containing package,
-                # otherwise it will be picked up by package_data wildcard expression.
-                if rel_segments[0] not in packages:
-                    # directories may not have their own entry
-                    packages.append(rel_segments[0])
-
-            # all existing files and dirs need to be added without changing
-            out_tar.addfile(out_info, io.BytesIO(content))
-
-        assert wrapper_dir
-        assert metadata_bytes
-
-        logger.debug("%s is optimized for upip. Re-constructing missing files", file_name)
-        logger.debug("py_modules: %r", py_modules)
-        logger.debug("packages: %r", packages)
-        logger.debug("requirements: %r", requirements)
-        metadata = self._parse_metadata(metadata_bytes)
-        logger.debug("metadata: %r", metadata)
-        setup_py = self._create_setup_py(metadata, py_modules, packages, requirements)
-        logger.debug("setup.py: %s", setup_py)
-
-        self._add_file_to_tar(wrapper_dir + "/setup.py", setup_py.encode("utf-8"), out_tar)
-        self._add_file_to_tar(wrapper_dir + "/PKG-INFO", metadata_bytes, out_tar)
-        self._add_file_to_tar(
-            wrapper_dir + "/setup.cfg",
-            b"""[egg_info]
+                    top_name, sep, _ = rel_name.partition("/")
+                    if not sep:
+                        # toplevel item outside of egg-info
+                        if is_file and rel_name.endswith(".py"):
+                            # toplevel module
+                            module_name = rel_name[: -len(".py")]
+                            py_modules.append(module_name)
+                        elif is_dir:
+                            # Assuming all toplevel directories represent packages.
+                            packages.append(rel_name)
+                            known_packages.add(rel_name)
+                    elif top_name not in known_packages:
+                        # Assuming an item inside a subdirectory.
+                        # If it's a py, it will be included together with containing package,
+                        # otherwise it will be picked up by package_data wildcard expression.
+                        # Directories may not have their own entry.
+                        packages.append(top_name)
+                        known_packages.add(top_name)
+
+                # all existing files and dirs need to be added without changing
+                if content is not None:
+                    out_tar.addfile(out_info, io.BytesIO(content))
+                elif is_file:
+                    with in_tar.extractfile(info) as f:
+                        out_tar.addfile(out_info, f)
+                else:
+                    out_tar.addfile(out_info)
+
+            assert wrapper_dir
+            assert metadata_bytes
+
+            logger.debug("%s is optimized for upip. Re-constructing missing files", file_name)
+            logger.debug("py_modules: %r", py_modules)
+            logger.debug("packages: %r", packages)
+            logger.debug("requirements: %r", requirements)
+            metadata = self._parse_metadata(metadata_bytes)
+            logger.debug("metadata: %r", metadata)
+            setup_py = self._create_setup_py(metadata, py_modules, packages, requirements)
+            logger.debug("setup.py: %s", setup_py)
+
+            self._add_file_to_tar(wrapper_dir + "/setup.py", setup_py.encode("utf-8"), out_tar)
+            self._add_file_to_tar(wrapper_dir + "/PKG-INFO", metadata_bytes, out_tar)
+            self._add_file_to_tar(
+                wrapper_dir + "/setup.cfg",
+                b"""[egg_info]
 tag_build = 
 tag_date = 0
 """,
-            out_tar,
-        )
-        self._add_file_to_tar(
-            wrapper_dir + "/" + egg_info_path + "/dependency_links.txt", b"\n", out_tar
-        )
-        self._add_file_to_tar(
-            wrapper_dir + "/" + egg_info_path + "/top_level.txt",
-            ("\n".join(packages + py_modules) + "\n").encode("utf-8"),
-            out_tar,
-        )
-
-        # TODO: recreate SOURCES.txt and test with data files
+                out_tar,
+            )
+            self._add_file_to_tar(
+                wrapper_dir + "/" + egg_info_path + "/dependency_links.txt", b"\n", out_tar
+            )
+            self._add_file_to_tar(
+                wrapper_dir + "/" + egg_info_path + "/top_level.txt",
+                ("\n".join(packages + py_modules) + "\n").encode("utf-8"),
+                out_tar,
+            )
 
-        out_tar.close()
+            # TODO: recreate SOURCES.txt and test with data files
 
         out_bytes = out_buffer.getvalue()
 
@@ -279,6 +454,10 @@ tag_date = 0
 
         return out_bytes
 
+    def _read_member(self, tar: tarfile.TarFile, info: tarfile.TarInfo) -> bytes:
+        with tar.extractfile(info) as f:
+            return f.read()
+
     def _add_file_to_tar(self, name: str, content: bytes, tar: tarfile.TarFile) -> None:
         stream = io.BytesIO(content)
         info = tarfile.TarInfo(name=name)
@@ -358,10 +537,9 @@ class SimpleIndexDownloader(RegularIndexDownloader):
         logger.info("Downloading file urls from simple index %s", url)
 
         try:
-            with urlopen(url) as fp:
-                parser = SimpleUrlsParser()
-                parser.feed(fp.read().decode("utf-8"))
-                return parser.file_urls
+            parser = SimpleUrlsParser()
+            parser.feed(download_bytes(url).decode("utf-8"))
+            return parser.file_urls
         except HTTPError as e:
             if e.code == 404:
                 return None
@@ -376,23 +554,22 @@ class JsonIndexDownloader(RegularIndexDownloader):
 
         result = {}
         try:
-            with urlopen(metadata_url) as fp:
-                data = json.load(fp)
-                releases = data["releases"]
-                for ver in releases:
-                    for file in releases[ver]:
-                        file_url = file["url"]
-                        if "filename" in file:
-                            file_name = file["filename"]
-                        else:
-                            # micropython.org/pi doesn't have it
-                            file_name = file_url.split("/")[-1]
-                            # may be missing micropython prefix
-                            if not file_name.startswith(dist_name):
-                                # Let's hope version part doesn't contain dashes
-                                _, suffix = file_name.split("-")
-                                file_name = dist_name + "-" + suffix
-                        result[file_name] = file_url
+            data = download_json(metadata_url)
+            releases = data["releases"]
+            for ver in releases:
+                for file in releases[ver]:
+                    file_url = file["url"]
+                    if "filename" in file:
+                        file_name = file["filename"]
+                    else:
+                        # micropython.org/pi doesn't have it
+                        file_name = file_url.split("/")[-1]
+                        # may be missing micropython prefix
+                        if not file_name.startswith(dist_name):
+                            # Let's hope version part doesn't contain dashes
+                            _, suffix = file_name.split("-")
+                            file_name = dist_name + "-" + suffix
+                    result[file_name] = file_url
         except HTTPError as e:
             if e.code == 404:
                 return None
@@ -411,7 +588,7 @@ class MpOrgV1IndexDownloader(JsonIndexDownloader):
 
 class MpOrgV2IndexDownloader(BaseIndexDownloader):
     def __init__(self, index_url):
-        self._packages = None
+        self._packages_by_normalized_name: Optional[Dict[str, Dict[Any, Any]]] = None
         super().__init__(index_url)
 
     def get_dist_file_names(self, dist_name: str) -> Optional[List[str]]:
@@ -421,14 +598,16 @@ class MpOrgV2IndexDownloader(BaseIndexDownloader):
             return None
 
         # Collect relationship between version and constructed file names so that I won't need to parse file name later.
-        meta["original_versions_per_file_name"] = {}
+        original_versions_per_file_name = {}
 
         result = []
         for version in meta["versions"]["py"]:
             file_name = create_dist_info_version_name(dist_name, version) + "-py3-none-any.whl"
-            meta["original_versions_per_file_name"][file_name] = version
+            original_versions_per_file_name[file_name] = version
             result.append(file_name)
 
+        # publish only the complete mapping
+        meta["original_versions_per_file_name"] = original_versions_per_file_name
         return result
 
     def get_file_content(self, dist_name: str, file_name: str) -> bytes:
@@ -441,8 +620,8 @@ class MpOrgV2IndexDownloader(BaseIndexDownloader):
         assert isinstance(original_version, str)
 
         version_meta_url = f"{self._index_url}/package/py/{original_name}/{original_version}.json"
-        with urlopen(version_meta_url) as fp:
-            version_meta = json.load(fp)
+        # metadata of a published version doesn't change
+        version_meta = download_json(version_meta_url, max_age=None)
 
         return self._construct_wheel_content(dist_meta, version_meta)
 
@@ -459,10 +638,16 @@ class MpOrgV2IndexDownloader(BaseIndexDownloader):
         for wheel_path, url in version_meta.get("urls", []):
             urls_per_wheel_path[wheel_path] = url
 
+        # Files are independent of each other, so download them concurrently.
+        # Keep the original order, because it determines the order in the wheel.
         bytes_per_wheel_path = {}
-        for wheel_path, url in urls_per_wheel_path.items():
-            with urlopen(url) as fp:
-                bytes_per_wheel_path[wheel_path] = fp.read()
+        if urls_per_wheel_path:
+            with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+                for wheel_path, content in zip(
+                    urls_per_wheel_path,
+                    executor.map(download_bytes, urls_per_wheel_path.values()),
+                ):
+                    bytes_per_wheel_path[wheel_path] = content
 
         # construct metadata files
         meta_dir_prefix = create_dist_info_version_name(dist_meta["name"], version_meta["version"])
@@ -527,15 +712,22 @@ class MpOrgV2IndexDownloader(BaseIndexDownloader):
         return zip_buffer.getvalue()
 
     def _get_dist_metadata(self, dist_name: str) -> Optional[Dict[Any, Any]]:
-        if self._packages is None:
-            with urlopen(MP_ORG_INDEX_V2 + "/index.json") as fp:
-                self._packages = json.load(fp)["packages"]
+        with self._cache_lock:
+            if self._packages_by_normalized_name is None:
+                packages = download_json(MP_ORG_INDEX_V2 + "/index.json")["packages"]
 
-        for package in self._packages:
-            if custom_normalize_dist_name(package["name"]) == custom_normalize_dist_name(dist_name):
-                return package
+                packages_by_normalized_name = {}
+                for package in packages:
+                    # keep the first one in case of duplicates, like the linear search would
+                    packages_by_normalized_name.setdefault(
+                        custom_normalize_dist_name(package["name"]), package
+                    )
+                # publish only the complete dict
+                self._packages_by_normalized_name = packages_by_normalized_name
 
-        return None
+            packages_by_normalized_name = self._packages_by_normalized_name
+
+        return packages_by_normalized_name.get(custom_normalize_dist_name(dist_name), None)
 
 
 class PipkinProxy(HTTPServer):
@@ -555,19 +747,34 @@ class PipkinProxy(HTTPServer):
 
     def get_downloader_for_dist(self, dist_name: str) -> Optional[BaseIndexDownloader]:
         if dist_name not in self._downloaders_by_dist_name:
-            for downloader in self._downloaders:
+            self._downloaders_by_dist_name[dist_name] = self._find_downloader_for_dist(dist_name)
+
+        return self._downloaders_by_dist_name[dist_name]
+
+    def _find_downloader_for_dist(self, dist_name: str) -> Optional[BaseIndexDownloader]:
+        # Query all indexes at once, so that falling back to a later index doesn't cost
+        # an extra round trip. The first index (in the order of preference) having the dist
+        # still wins, and the answer is returned as soon as it and the indexes before it
+        # have answered. Slower lookups finish in the background (their results get cached
+        # by the downloaders, which guard their caches with a lock).
+        executor = ThreadPoolExecutor(max_workers=len(self._downloaders))
+        try:
+            futures = [
+                executor.submit(downloader.get_dist_file_names, dist_name)
+                for downloader in self._downloaders
+            ]
+            for downloader, future in zip(self._downloaders, futures):
                 logger.debug("Checking if %s has %r", downloader, dist_name)
-                file_names = downloader.get_dist_file_names(dist_name)
+                file_names = future.result()
                 if file_names is not None:
                     logger.debug("Got %r file names", len(file_names))
-                    self._downloaders_by_dist_name[dist_name] = downloader
-                    break
+                    return downloader
                 else:
                     logger.debug("Got None. Trying next downloader")
-            else:
-                self._downloaders_by_dist_name[dist_name] = None
 
-        return self._downloaders_by_dist_name[dist_name]
+            return None
+        finally:
+            executor.shutdown(wait=False)
 
     def get_index_url(self) -> str:
         return f"http://127.0.0.1:{self.server_port}"
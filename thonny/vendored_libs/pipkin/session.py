@@ -21,7 +21,7 @@ from pipkin.common import UserError
 from pipkin.proxy import start_proxy
 from pipkin.util import (
     get_base_executable,
-    get_user_cache_dir,
+    get_pipkin_cache_dir,
     get_venv_executable,
     get_venv_site_packages_path,
     parse_meta_dir_name,
@@ -51,6 +51,7 @@ class Session:
         self._adapter = adapter
         self._venv_lock: Optional[BaseFileLock] = None
         self._venv_dir: Optional[str] = None
+        self._venv_site_packages_path: Optional[str] = None
         self._quiet = False
         self._tty = tty
 
@@ -403,7 +404,8 @@ class Session:
     ) -> None:
         self._report_progress(f"Copying {parse_meta_dir_name(meta_dir_name)[0]}", end="")
         rel_record_path = os.path.join(meta_dir_name, "RECORD")
-        record_path = os.path.join(self._get_venv_site_packages_path(), rel_record_path)
+        site_packages_path = self._get_venv_site_packages_path()
+        record_path = os.path.join(site_packages_path, rel_record_path)
         assert os.path.exists(record_path)
 
         target_record_lines = []
@@ -423,14 +425,13 @@ class Session:
                 continue
 
             # only consider METADATA from meta dir
-            if rel_path.startswith(meta_dir_name) and os.path.basename(rel_path) != "METADATA":
-                continue
-
-            full_path = os.path.normpath(
-                os.path.join(self._get_venv_site_packages_path(), rel_path)
-            )
+            is_metadata = False
+            if rel_path.startswith(meta_dir_name):
+                if os.path.basename(rel_path) != "METADATA":
+                    continue
+                is_metadata = True
 
-            full_device_path = self._adapter.join_path(target, self._adapter.normpath(rel_path))
+            full_path = os.path.normpath(os.path.join(site_packages_path, rel_path))
 
             if full_path.endswith(".py") and compile:
                 self._compile_with_mpy_cross(
@@ -438,18 +439,20 @@ class Session:
                 )
                 # forget about the .py file
                 full_path = self._get_compiled_path(full_path)
-                full_device_path = self._get_compiled_path(full_device_path)
                 rel_path = self._get_compiled_path(rel_path)
 
+            device_rel_path = self._adapter.normpath(rel_path)
+            full_device_path = self._adapter.join_path(target, device_rel_path)
+
             with open(full_path, "rb") as source_fp:
                 content = source_fp.read()
 
-            if rel_path.startswith(meta_dir_name) and os.path.basename(rel_path) == "METADATA":
+            if is_metadata:
                 content = self._trim_metadata(content)
 
             self._adapter.write_file(full_device_path, content)
             self._report_progress(".", end="")
-            target_record_lines.append(self._adapter.normpath(rel_path) + ",,")
+            target_record_lines.append(device_rel_path + ",,")
 
         # add RECORD (without hashes)
         target_record_lines.append(self._adapter.normpath(rel_record_path) + ",,")
@@ -532,7 +535,11 @@ class Session:
         return lock, path
 
     def _get_venv_site_packages_path(self) -> str:
-        return get_venv_site_packages_path(self._venv_dir)
+        # Querying it requires starting the venv interpreter, and the venv doesn't change
+        # during the session
+        if self._venv_site_packages_path is None:
+            self._venv_site_packages_path = get_venv_site_packages_path(self._venv_dir)
+        return self._venv_site_packages_path
 
     def _patch_pip(self, venv_path: str) -> None:
         sp_cmd = [
@@ -656,11 +663,7 @@ pip._vendor.distlib.markers.DEFAULT_CONTEXT = \
         return os.path.join(self._get_pipkin_cache_dir(), "workspaces")
 
     def _get_pipkin_cache_dir(self) -> str:
-        result = os.path.join(get_user_cache_dir(), "pipkin")
-        if sys.platform == "win32":
-            # Windows doesn't have separate user cache dir
-            result = os.path.join(result, "cache")
-        return result
+        return get_pipkin_cache_dir()
 
     def _is_initial_venv_item(self, name: str) -> bool:
         return (
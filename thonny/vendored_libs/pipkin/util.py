@@ -3,11 +3,10 @@ import re
 import subprocess
 import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from logging import getLogger
 from typing import List, Optional, Set, Tuple
 
-import pkg_resources
-
 logger = getLogger(__name__)
 
 
@@ -51,12 +50,109 @@ def parse_wheel_filename(filename: str) -> ParsedWheelFilename:
     )
 
 
+@lru_cache(maxsize=4096)
 def create_dist_info_version_name(dist_name: str, version: str) -> str:
     # https://packaging.python.org/en/latest/specifications/binary-distribution-format/#escaping-and-unicode
     # https://peps.python.org/pep-0440/
-    safe_name = pkg_resources.safe_name(dist_name).replace("-", "_")
-    safe_version = pkg_resources.safe_version(version)
-    return f"{safe_name}-{safe_version}"
+    return f"{safe_name(dist_name).replace('-', '_')}-{safe_version(version)}"
+
+
+def safe_name(name: str) -> str:
+    """Same as pkg_resources.safe_name, which is slow to import"""
+    return re.sub("[^A-Za-z0-9.]+", "-", name)
+
+
+def safe_version(version: str) -> str:
+    """Same as pkg_resources.safe_version, which is slow to import"""
+    normalized = normalize_pep440_version(version)
+    if normalized is not None:
+        return normalized
+
+    version = version.replace(" ", ".")
+    return re.sub("[^A-Za-z0-9.]+", "-", version)
+
+
+# https://peps.python.org/pep-0440/#appendix-b-parsing-version-strings-with-regular-expressions
+PEP440_VERSION_REGEX = re.compile(
+    r"""
+    ^\s*
+    v?
+    (?:
+        (?:(?P<epoch>[0-9]+)!)?
+        (?P<release>[0-9]+(?:\.[0-9]+)*)
+        (?P<pre>
+            [-_\.]?
+            (?P<pre_l>alpha|a|beta|b|preview|pre|c|rc)
+            [-_\.]?
+            (?P<pre_n>[0-9]+)?
+        )?
+        (?P<post>
+            (?:-(?P<post_n1>[0-9]+))
+            |
+            (?:
+                [-_\.]?
+                (?P<post_l>post|rev|r)
+                [-_\.]?
+                (?P<post_n2>[0-9]+)?
+            )
+        )?
+        (?P<dev>
+            [-_\.]?
+            (?P<dev_l>dev)
+            [-_\.]?
+            (?P<dev_n>[0-9]+)?
+        )?
+    )
+    (?:\+(?P<local>[a-z0-9]+(?:[-_\.][a-z0-9]+)*))?
+    \s*$
+    """,
+    re.VERBOSE | re.IGNORECASE,
+)
+
+PEP440_PRE_RELEASE_LABELS = {
+    "alpha": "a",
+    "a": "a",
+    "beta": "b",
+    "b": "b",
+    "c": "rc",
+    "pre": "rc",
+    "preview": "rc",
+    "rc": "rc",
+}
+
+
+def normalize_pep440_version(version: str) -> Optional[str]:
+    """
+    Returns the normalized form of a valid PEP 440 version (same as str(packaging.version.Version))
+    or None if the version is not valid.
+    """
+    match = PEP440_VERSION_REGEX.match(version)
+    if not match:
+        return None
+
+    result = ""
+    if match.group("epoch") and int(match.group("epoch")) != 0:
+        result += f"{int(match.group('epoch'))}!"
+
+    result += ".".join(str(int(part)) for part in match.group("release").split("."))
+
+    if match.group("pre"):
+        label = PEP440_PRE_RELEASE_LABELS[match.group("pre_l").lower()]
+        result += f"{label}{int(match.group('pre_n') or 0)}"
+
+    if match.group("post"):
+        result += f".post{int(match.group('post_n1') or match.group('post_n2') or 0)}"
+
+    if match.group("dev"):
+        result += f".dev{int(match.group('dev_n') or 0)}"
+
+    if match.group("local"):
+        local_parts = re.split(r"[-_\.]", match.group("local"))
+        result += "+" + ".".join(
+            str(int(part)) if part.isdigit() else part.lower() for part in local_parts
+        )
+
+    return result
 
 
 def get_windows_folder(ID: int) -> str:
@@ -91,6 +187,14 @@ def get_user_cache_dir() -> str:
         return os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
 
 
+def get_pipkin_cache_dir() -> str:
+    result = os.path.join(get_user_cache_dir(), "pipkin")
+    if sys.platform == "win32":
+        # Windows doesn't have separate user cache dir
+        result = os.path.join(result, "cache")
+    return result
+
+
 def get_base_executable():
     if sys.exec_prefix == sys.base_exec_prefix:
         return sys.executable
@@ -173,9 +277,10 @@ def is_continuation_byte(byte: int) -> bool:
     return (byte & 0b11000000) == 0b10000000
 
 
+@lru_cache(maxsize=4096)
 def custom_normalize_dist_name(name: str) -> str:
     # https://peps.python.org/pep-0503/#normalized-names
-    return pkg_resources.safe_name(name).lower().replace("-", "_").replace(".", "_")
+    return safe_name(name).lower().replace("-", "_").replace(".", "_")
 
 
 def list_volumes(skip_letters: Optional[Set[str]] = None) -> List[str]: